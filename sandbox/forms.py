@@ -1,24 +1,79 @@
 """Forms definition for the demo LTI consumer."""
 
 from django import forms
+from django.db.models.signals import post_delete, post_save
 from django.utils.translation import gettext_lazy as _
 
 from lti_toolbox.models import LTIPassport
 
+# Rendered (pk, label) passport choices, shared by all form instances of the process
+_PASSPORT_CHOICES = None
+
+
+def _get_passport_choices():
+    """Build the passport choices with a single query and keep them in memory."""
+    global _PASSPORT_CHOICES  # pylint: disable=global-statement
+    if _PASSPORT_CHOICES is None:
+        _PASSPORT_CHOICES = [
+            (pk, f"{consumer_slug} - {title}")
+            for pk, consumer_slug, title in LTIPassport.objects.values_list(
+                "id", "consumer__slug", "title"
+            )
+        ]
+    return _PASSPORT_CHOICES
+
+
+def _clear_passport_choices(**kwargs):  # pylint: disable=unused-argument
+    """Invalidate the cached passport choices when a passport is saved or deleted.
+
+    Passports created by `LTIPassport.bulk_create_passports` send no signal, they are
+    listed once another passport is saved or deleted, or after a process restart.
+    """
+    global _PASSPORT_CHOICES  # pylint: disable=global-statement
+    _PASSPORT_CHOICES = None
+
+
+post_save.connect(_clear_passport_choices, sender=LTIPassport)
+post_delete.connect(_clear_passport_choices, sender=LTIPassport)
+
+_ROLE_CHOICES = (
+    ("Student", _("Student")),
+    ("Instructor", _("Instructor")),
+)
+
+_ACTION_CHOICES = (
+    ("lti.launch-url-verification", "Verify LTI launch request"),
+    ("lti.launch-url-auth", "Verify + authenticate user"),
+    (
+        "lti.launch-url-auth-with-params",
+        "Verify + authenticate user + dynamic URL",
+    ),
+)
+
+_LOCALE_CHOICES = (("fr", "fr"), ("en", "en"), ("", "--none--"))
+
+
+class PassportChoiceIterator(forms.models.ModelChoiceIterator):
+    """Iterate over the cached passport choices instead of the queryset."""
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        yield from _get_passport_choices()
+
+    def __len__(self):
+        return len(_get_passport_choices()) + (self.field.empty_label is not None)
+
 
 class PassportChoiceField(forms.ModelChoiceField):
     """Select an LTI password"""
 
-    def label_from_instance(self, obj):
-        return f"{obj.consumer.slug} - {obj.title}"
+    iterator = PassportChoiceIterator
 
 
 class LTIConsumerForm(forms.Form):
     """Form to configure the standalone LTI consumer."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
     passport = PassportChoiceField(
         queryset=LTIPassport.objects.all(), empty_label=None, label="Consumer"
     )
@@ -39,28 +94,16 @@ class LTIConsumerForm(forms.Form):
         label="Course Title", max_length=100, initial="Mathematics 101"
     )
 
-    role = forms.ChoiceField(
-        choices=(
-            ("Student", _("Student")),
-            ("Instructor", _("Instructor")),
-        )
-    )
+    role = forms.ChoiceField(choices=_ROLE_CHOICES)
 
     action = forms.ChoiceField(
-        choices=(
-            ("lti.launch-url-verification", "Verify LTI launch request"),
-            ("lti.launch-url-auth", "Verify + authenticate user"),
-            (
-                "lti.launch-url-auth-with-params",
-                "Verify + authenticate user + dynamic URL",
-            ),
-        ),
+        choices=_ACTION_CHOICES,
         initial="simple",
         required=True,
     )
 
     presentation_locale = forms.ChoiceField(
-        choices=(("fr", "fr"), ("en", "en"), ("", "--none--")),
+        choices=_LOCALE_CHOICES,
         initial="fr",
         label="Locale",
         required=False,
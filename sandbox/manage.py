@@ -5,10 +5,46 @@ django-lti-toolbox's sandbox management script.
 import os
 import sys
 
+# Commands that should always run the system checks, even when DJANGO_SKIP_CHECKS is set
+CHECKED_COMMANDS = ("check", "help", "migrate", "version")
+
+
+def can_skip_checks(name):
+    """Check that a management command runs system checks that can be skipped.
+
+    Django only accepts the --skip-checks option on commands requiring system checks.
+    """
+    # pylint: disable=import-outside-toplevel
+    import configurations
+    from django.core.management import BaseCommand, get_commands, load_command_class
+
+    configurations.setup()
+    try:
+        app_name = get_commands()[name]
+    except KeyError:
+        return False
+    command = (
+        app_name
+        if isinstance(app_name, BaseCommand)
+        else load_command_class(app_name, name)
+    )
+    return bool(command.requires_system_checks)
+
+
 if __name__ == "__main__":
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
     os.environ.setdefault("DJANGO_CONFIGURATION", "Development")
 
+    # Skip system checks when they have already been run (e.g. by the CI pipeline)
+    if (
+        os.environ.get("DJANGO_SKIP_CHECKS")
+        and len(sys.argv) > 1
+        and not sys.argv[1].startswith("-")
+        and sys.argv[1] not in CHECKED_COMMANDS
+        and can_skip_checks(sys.argv[1])
+    ):
+        sys.argv.insert(2, "--skip-checks")
+
     from configurations.management import execute_from_command_line  # noqa
 
     execute_from_command_line(sys.argv)
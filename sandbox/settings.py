@@ -37,9 +37,11 @@ class Base(Configuration):
     * DB_USER
     """
 
+    # ModelBackend comes first so that regular username/password logins do not
+    # go through the LTI backend.
     AUTHENTICATION_BACKENDS = [
-        "lti_toolbox.backend.LTIBackend",
         "django.contrib.auth.backends.ModelBackend",
+        "lti_toolbox.backend.LTIBackend",
     ]
 
     DEBUG = False
@@ -76,6 +78,8 @@ class Base(Configuration):
     WSGI_APPLICATION = "wsgi.application"
 
     # Database
+    # Values declared with an explicit environ_name are resolved from the environment
+    # once, when this class is created: DATABASES is a plain dict at runtime.
     DATABASES = {
         "default": {
             "ENGINE": values.Value(
@@ -143,7 +147,11 @@ class Base(Configuration):
 
     # Cache
     CACHES = {
-        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "lti-default",
+            "OPTIONS": {"MAX_ENTRIES": 10000, "CULL_FREQUENCY": 4},
+        },
     }
 
 
@@ -208,6 +216,19 @@ class Production(Base):
     SECURE_BROWSER_XSS_FILTER = True
     SECURE_CONTENT_TYPE_NOSNIFF = True
     SESSION_COOKIE_SECURE = True
+
+    # The admin site and the messages framework are not served by production workers
+    INSTALLED_APPS = [
+        app
+        for app in Base.INSTALLED_APPS
+        if app not in ("django.contrib.admin", "django.contrib.messages")
+    ]
+    MIDDLEWARE = [
+        middleware
+        for middleware in Base.MIDDLEWARE
+        if middleware != "django.contrib.messages.middleware.MessageMiddleware"
+    ]
+
     # System check reference:
     # https://docs.djangoproject.com/en/2.2/ref/checks/#security
     SILENCED_SYSTEM_CHECKS = values.ListValue(
@@ -1,20 +1,24 @@
 """
 sandbox URLs
 """
+from django.apps import apps
 from django.contrib import admin
-from django.urls import path, re_path, reverse_lazy
+from django.urls import path
 from django.views.generic import RedirectView
 
-from views import LaunchURLWithAuth, SimpleLaunchURLVerification, demo_consumer
+from views import LaunchURLWithAuth, SimpleLaunchURLVerification, demo_consumer, health
 
 urlpatterns = [
     # / Redirects to the demo consumer
-    re_path(
-        r"^$",
-        RedirectView.as_view(url=reverse_lazy("demo_consumer"), permanent=False),
+    path(
+        "",
+        RedirectView.as_view(pattern_name="demo_consumer", permanent=False),
+        name="root",
     ),
+    # Health check, also used to warm up WSGI workers
+    path("health", health, name="health"),
     # Demo LTI consumer
-    re_path(r"^consumer$", demo_consumer, name="demo_consumer"),
+    path("consumer", demo_consumer, name="demo_consumer"),
     # Simple LTI launch request verification
     path(
         "lti/launch-verification",
@@ -33,6 +37,8 @@ urlpatterns = [
         LaunchURLWithAuth.as_view(),
         name="lti.launch-url-auth-with-params",
     ),
-    # Django admin
-    path("admin/", admin.site.urls),
 ]
+
+# Django admin, not installed in production configurations
+if apps.is_installed("django.contrib.admin"):
+    urlpatterns.append(path("admin/", admin.site.urls))
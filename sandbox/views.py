@@ -1,15 +1,15 @@
 """Views of the lti_toolbox django application."""
 import uuid
-from urllib.parse import unquote
+from functools import lru_cache
 
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import render
 from django.urls import reverse
 from django.views.decorators.csrf import csrf_exempt
 from oauthlib import oauth1
+from oauthlib.oauth1.rfc5849.utils import parse_authorization_header, unescape
 
 from lti_toolbox.exceptions import LTIException
-from lti_toolbox.factories import LTIConsumerFactory, LTIPassportFactory
 from lti_toolbox.lti import LTI
 from lti_toolbox.models import LTIPassport
 from lti_toolbox.views import BaseLTIAuthView, BaseLTIView
@@ -20,19 +20,21 @@ from forms import LTIConsumerForm
 class SimpleLaunchURLVerification(BaseLTIView):
     """Example view to handle LTI launch request verification."""
 
+    template_name = "demo/debug_infos.html"
+
     def _do_on_success(self, lti_request: LTI, *args, **kwargs) -> HttpResponse:
         # Render a template with some debugging information
         context = {
             "message": "LTI request verified successfully",
         }
-        return render(self.request, "demo/debug_infos.html", context)
+        return render(lti_request.request, self.template_name, context)
 
     def _do_on_failure(self, request: HttpRequest, error: LTIException) -> HttpResponse:
         context = {
             "message": "INVALID LTI request (check your django logs for more details)",
             "message_class": "danger",
         }
-        return render(self.request, "demo/debug_infos.html", context, status=403)
+        return render(request, self.template_name, context, status=403)
 
 
 class LaunchURLWithAuth(BaseLTIAuthView):
@@ -43,6 +45,8 @@ class LaunchURLWithAuth(BaseLTIAuthView):
     has been defined in the `AUTHENTICATION_BACKENDS` setting.
     """
 
+    template_name = "demo/debug_infos.html"
+
     def _do_on_login(self, lti_request: LTI) -> HttpResponse:
         """Process the request when the user is logged in via LTI"""
         context = {
@@ -56,7 +60,12 @@ class LaunchURLWithAuth(BaseLTIAuthView):
                 },
             },
         }
-        return render(self.request, "demo/debug_infos.html", context)
+        return render(self.request, self.template_name, context)
+
+
+def health(request: HttpRequest) -> HttpResponse:  # pylint: disable=W0613
+    """Lightweight endpoint used to check that the application is up."""
+    return HttpResponse("ok", content_type="text/plain")
 
 
 ##################################################################################
@@ -64,17 +73,48 @@ class LaunchURLWithAuth(BaseLTIAuthView):
 ##################################################################################
 
 
+# Primary key of the demo passport, bootstrapped once per process
+_DEV_PASSPORT_PK = None
+
+# Launch URLs already reversed, by action
+_LAUNCH_URLS = {}
+_PLACEHOLDER_UUID = uuid.UUID(int=0)
+
+
+def _get_dev_passport_pk() -> int:
+    """Ensure that at least the demo consumer exists with a passport."""
+    global _DEV_PASSPORT_PK  # pylint: disable=global-statement
+    if _DEV_PASSPORT_PK is None:
+        # factory_boy (and faker) are only loaded when the demo passport is bootstrapped
+        # pylint: disable=import-outside-toplevel
+        from lti_toolbox.factories import LTIConsumerFactory, LTIPassportFactory
+
+        consumer = LTIConsumerFactory(slug="dev_consumer", title="Dev consumer")
+        passport = LTIPassportFactory(title="Dev passport", consumer=consumer)
+        _DEV_PASSPORT_PK = passport.pk
+    return _DEV_PASSPORT_PK
+
+
+def _get_dev_passport() -> LTIPassport:
+    """Retrieve the demo passport, bootstrapping it again if it was deleted."""
+    global _DEV_PASSPORT_PK  # pylint: disable=global-statement
+    try:
+        return LTIPassport.objects.get(pk=_get_dev_passport_pk())
+    except LTIPassport.DoesNotExist:
+        _DEV_PASSPORT_PK = None
+        return LTIPassport.objects.get(pk=_get_dev_passport_pk())
+
+
 @csrf_exempt
 def demo_consumer(request: HttpRequest) -> HttpResponse:
     """Display the demo LTI consumer"""
 
-    # Ensure that at least the demo consumer exists with a passport
-    consumer = LTIConsumerFactory(slug="dev_consumer", title="Dev consumer")
-    passport = LTIPassportFactory(title="Dev passport", consumer=consumer)
+    _get_dev_passport_pk()
 
     if request.method == "POST":
         form = LTIConsumerForm(request.POST)
         if form.is_valid():
+            passport = _get_dev_passport()
             launch_url = request.build_absolute_uri(_get_launch_url(form.cleaned_data))
             lti_params = _generate_signed_parameters(form, launch_url, passport)
             return render(
@@ -90,7 +130,9 @@ def demo_consumer(request: HttpRequest) -> HttpResponse:
 
 def _generate_signed_parameters(form: LTIConsumerForm, url: str, passport: LTIPassport):
 
-    user_id = form.cleaned_data["user_id"]
+    cleaned_data = form.cleaned_data
+    user_id = cleaned_data["user_id"]
+    presentation_locale = cleaned_data["presentation_locale"]
 
     lti_parameters = {
         "lti_message_type": "basic-lti-launch-request",
@@ -98,18 +140,16 @@ def _generate_signed_parameters(form: LTIConsumerForm, url: str, passport: LTIPa
         "resource_link_id": str(uuid.uuid4()),
         "lis_person_contact_email_primary": f"{user_id}@example.com",
         "lis_person_sourcedid": user_id,
-        "user_id": form.cleaned_data["user_id"],
-        "context_id": form.cleaned_data["context_id"],
-        "context_title": form.cleaned_data["course_title"],
-        "roles": form.cleaned_data["role"],
+        "user_id": user_id,
+        "context_id": cleaned_data["context_id"],
+        "context_title": cleaned_data["course_title"],
+        "roles": cleaned_data["role"],
     }
-    if form.cleaned_data["presentation_locale"]:
-        lti_parameters["launch_presentation_locale"] = form.cleaned_data[
-            "presentation_locale"
-        ]
+    if presentation_locale:
+        lti_parameters["launch_presentation_locale"] = presentation_locale
 
-    oauth_client = oauth1.Client(
-        client_key=passport.oauth_consumer_key, client_secret=passport.shared_secret
+    oauth_client = _get_oauth_client(
+        passport.oauth_consumer_key, passport.shared_secret
     )
     # Compute Authorization header which looks like:
     # Authorization: OAuth oauth_nonce="80966668944732164491378916897",
@@ -123,23 +163,38 @@ def _generate_signed_parameters(form: LTIConsumerForm, url: str, passport: LTIPa
     )
 
     # Parse headers to pass to template as part of context:
-    oauth_dict = dict(
-        param.strip().replace('"', "").split("=")
-        for param in headers["Authorization"].split(",")
+    lti_parameters.update(
+        (key, unescape(value))
+        for key, value in parse_authorization_header(headers["Authorization"])
     )
-
-    signature = oauth_dict["oauth_signature"]
-    oauth_dict["oauth_signature"] = unquote(signature)
-    oauth_dict["oauth_nonce"] = oauth_dict.pop("OAuth oauth_nonce")
-    lti_parameters.update(oauth_dict)
     return lti_parameters
 
 
+@lru_cache(maxsize=128)
+def _get_oauth_client(client_key: str, client_secret: str) -> oauth1.Client:
+    """Get an oauth client for the given credentials.
+
+    Nonce and timestamp are generated on each call to `sign`, so clients can be
+    safely reused across requests.
+    """
+    return oauth1.Client(client_key=client_key, client_secret=client_secret)
+
+
+@lru_cache(maxsize=1024)
+def _get_context_uuid(context_id: str) -> uuid.UUID:
+    """Get the deterministic UUID identifying an LTI context."""
+    return uuid.uuid5(uuid.NAMESPACE_DNS, context_id)
+
+
 def _get_launch_url(cleaned_data):
-    if cleaned_data["action"] == "lti.launch-url-auth-with-params":
-        view_kwargs = {
-            "uuid": uuid.uuid5(uuid.NAMESPACE_DNS, cleaned_data["context_id"])
-        }
-    else:
-        view_kwargs = {}
-    return reverse(cleaned_data["action"], kwargs=view_kwargs)
+    action = cleaned_data["action"]
+    with_params = action == "lti.launch-url-auth-with-params"
+    if action not in _LAUNCH_URLS:
+        # Dynamic URLs are reversed once with a placeholder UUID
+        view_kwargs = {"uuid": _PLACEHOLDER_UUID} if with_params else {}
+        _LAUNCH_URLS[action] = reverse(action, kwargs=view_kwargs)
+    launch_url = _LAUNCH_URLS[action]
+    if with_params:
+        context_uuid = _get_context_uuid(cleaned_data["context_id"])
+        return launch_url.replace(str(_PLACEHOLDER_UUID), str(context_uuid))
+    return launch_url
@@ -7,7 +7,10 @@ For more information on this file, see
 https://docs.djangoproject.com/en/2.2/howto/deployment/wsgi/
 """
 
+import logging
 import os
+import sys
+from io import BytesIO
 
 from configurations.wsgi import get_wsgi_application
 
@@ -15,3 +18,46 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
 os.environ.setdefault("DJANGO_CONFIGURATION", "Development")
 
 application = get_wsgi_application()
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_up(wsgi_application):
+    """Serve a request to the health endpoint so that the URL resolver is built
+    when the application is loaded (e.g. with gunicorn --preload) instead of on
+    the first real request.
+
+    It is only run when the DJANGO_WSGI_WARM_UP environment variable is set."""
+    # pylint: disable=import-outside-toplevel
+    from django.conf import settings
+
+    host = next(
+        (host.lstrip(".") for host in settings.ALLOWED_HOSTS or [] if host != "*"),
+        "localhost",
+    )
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/health",
+        "QUERY_STRING": "",
+        "SERVER_NAME": host,
+        "SERVER_PORT": "80",
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "HTTP_HOST": host,
+        "wsgi.input": BytesIO(b""),
+        "wsgi.errors": sys.stderr,
+        "wsgi.url_scheme": "http",
+        "wsgi.version": (1, 0),
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    try:
+        response = wsgi_application(environ, lambda *args, **kwargs: None)
+        response.close()
+    except Exception:  # pylint: disable=broad-except
+        # Workers must boot even if the warm-up fails, requests will build the resolver
+        logger.exception("Unable to warm up the WSGI application")
+
+
+if os.environ.get("DJANGO_WSGI_WARM_UP"):
+    _warm_up(application)
@@ -14,6 +14,11 @@ class LTIConsumerAdmin(admin.ModelAdmin):
         "title",
     )
 
+    search_fields = (
+        "slug",
+        "title",
+    )
+
 
 @admin.register(LTIPassport)
 class LTIPassportAdmin(admin.ModelAdmin):
@@ -21,11 +26,14 @@ class LTIPassportAdmin(admin.ModelAdmin):
 
     list_display = (
         "title",
+        "consumer",
         "oauth_consumer_key",
         "is_enabled",
     )
 
-    readonly_fields = [
+    list_select_related = ("consumer",)
+
+    readonly_fields = (
         "oauth_consumer_key",
         "shared_secret",
-    ]
+    )
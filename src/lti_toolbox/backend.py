@@ -5,6 +5,7 @@ from typing import Any
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import make_password
 from django.core.exceptions import PermissionDenied
 
 from lti_toolbox.lti import LTI
@@ -18,6 +19,8 @@ class LTIBackend(ModelBackend):
     """
     Authentication backend used by the lti_toolbox.views.BaseLTIAuthView
     It authenticates a user from a verified LTI request and creates a User if necessary.
+    Users are created with the default manager's `get_or_create`: custom logic of the
+    user manager's `create_user` method is not called.
 
     You are encouraged to make your own authentication backend to add your own domain logic.
     """
@@ -43,20 +46,30 @@ class LTIBackend(ModelBackend):
         if not lti_request.is_valid:
             raise PermissionDenied()
 
-        username = self._get_mandatory_param(lti_request, "user_id")
+        # Normalized as create_user does, users are created without calling it
+        username = USER_MODEL.normalize_username(
+            self._get_mandatory_param(lti_request, "user_id")
+        )
         email = self._get_mandatory_param(
             lti_request, "lis_person_contact_email_primary"
         )
 
-        logger.debug("User %s authenticated from LTI request", username)
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("User %s authenticated from LTI request", username)
 
-        try:
-            user = USER_MODEL.objects.get_by_natural_key(username)
-        except USER_MODEL.DoesNotExist:
-            user = USER_MODEL.objects.create_user(username, email=email)
+        user, created = USER_MODEL.objects.get_or_create(
+            **{USER_MODEL.USERNAME_FIELD: username},
+            defaults={
+                "email": USER_MODEL.objects.normalize_email(email),
+                "password": make_password(None),
+            },
+        )
+        if created and debug:
             logger.debug("User %s created in database", username)
         if not user.is_active:
-            logger.debug("User %s is not active", user.username)
+            if debug:
+                logger.debug("User %s is not active", user.username)
             raise PermissionDenied()
         return user
 
@@ -74,8 +87,11 @@ class LTIBackend(ModelBackend):
             PermissionDenied if the parameter is not defined
         """
         value = lti_request.get_param(param)
+        debug = logger.isEnabledFor(logging.DEBUG)
         if not value:
-            logger.debug("Unable to find param %s in LTI request", param)
+            if debug:
+                logger.debug("Unable to find param %s in LTI request", param)
             raise PermissionDenied()
-        logger.debug("%s = %s", param, value)
+        if debug:
+            logger.debug("%s = %s", param, value)
         return value
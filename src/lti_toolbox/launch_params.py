@@ -3,9 +3,10 @@ Utilities to represent and validate LTI Launch parameters
 
 This is based on lti library (https://github.com/pylti/lti).
 """
-from collections.abc import MutableMapping
+from collections.abc import Mapping, MutableMapping
 from enum import Enum
-from typing import List, Set, Union
+from functools import cached_property
+from typing import FrozenSet
 from urllib.parse import urlencode
 
 from .exceptions import InvalidParamException, MissingParamException
@@ -32,102 +33,120 @@ class LTIMessageType(str, Enum):
     SELECTION_RESPONSE = "ContentItemSelection"
 
 
-LAUNCH_PARAMS_REQUIRED = {"lti_message_type", "lti_version", "resource_link_id"}
-
-LAUNCH_PARAMS_RECOMMENDED = {
-    "context_id",
-    "context_label",
-    "context_title",
-    "context_type",
-    "launch_presentation_css_url",
-    "launch_presentation_document_target",
-    "launch_presentation_height",
-    "launch_presentation_locale",
-    "launch_presentation_return_url",
-    "launch_presentation_width",
-    "lis_person_contact_email_primary",
-    "lis_person_name_family",
-    "lis_person_name_full",
-    "lis_person_name_given",
-    "resource_link_description",
-    "resource_link_title",
-    "roles",
-    "role_scope_mentor",
-    "tool_consumer_info_product_family_code",
-    "tool_consumer_info_version",
-    "tool_consumer_instance_contact_email",
-    "tool_consumer_instance_description",
-    "tool_consumer_instance_guid",
-    "tool_consumer_instance_name",
-    "tool_consumer_instance_url",
-    "user_id",
-    "user_image",
-}
-
-LAUNCH_PARAMS_LIS = {
-    "lis_course_offering_sourcedid",
-    "lis_course_section_sourcedid",
-    "lis_outcome_service_url",
-    "lis_person_sourcedid",
-    "lis_result_sourcedid",
-}
-
-LAUNCH_PARAMS_RETURN_URL = {
-    "lti_errorlog",
-    "lti_errormsg",
-    "lti_log",
-    "lti_msg",
-}
-
-LAUNCH_PARAMS_OAUTH = {
-    "oauth_callback",
-    "oauth_consumer_key",
-    "oauth_nonce",
-    "oauth_signature",
-    "oauth_signature_method",
-    "oauth_timestamp",
-    "oauth_token",
-    "oauth_version",
-}
-
-LAUNCH_PARAMS_IS_LIST = {
-    "accept_media_types",
-    "accept_presentation_document_targets",
-    "context_type",
-    "role_scope_mentor",
-    "roles",
-}
-
-LAUNCH_PARAMS_CANVAS = {"selection_directive", "text"}
-
-CONTENT_PARAMS_REQUEST = {
-    "accept_copy_advice",
-    "accept_media_types",
-    "accept_multiple",
-    "accept_presentation_document_targets",
-    "accept_unsigned",
-    "auto_create",
-    "can_confirm",
-    "content_item_return_url",
-    "data",
-    "title",
-}
-
-CONTENT_PARAMS_RESPONSE = {
-    "content_items",
-    "lti_errorlog",
-    "lti_errormsg",
-    "lti_log",
-    "lti_msg",
-}
-
-REGISTRATION_PARAMS = {
-    "reg_key",
-    "reg_password",
-    "tc_profile_url",
-}
-
-LAUNCH_PARAMS = (
+LAUNCH_PARAMS_REQUIRED: FrozenSet[str] = frozenset(
+    {"lti_message_type", "lti_version", "resource_link_id"}
+)
+
+LAUNCH_PARAMS_RECOMMENDED: FrozenSet[str] = frozenset(
+    {
+        "context_id",
+        "context_label",
+        "context_title",
+        "context_type",
+        "launch_presentation_css_url",
+        "launch_presentation_document_target",
+        "launch_presentation_height",
+        "launch_presentation_locale",
+        "launch_presentation_return_url",
+        "launch_presentation_width",
+        "lis_person_contact_email_primary",
+        "lis_person_name_family",
+        "lis_person_name_full",
+        "lis_person_name_given",
+        "resource_link_description",
+        "resource_link_title",
+        "roles",
+        "role_scope_mentor",
+        "tool_consumer_info_product_family_code",
+        "tool_consumer_info_version",
+        "tool_consumer_instance_contact_email",
+        "tool_consumer_instance_description",
+        "tool_consumer_instance_guid",
+        "tool_consumer_instance_name",
+        "tool_consumer_instance_url",
+        "user_id",
+        "user_image",
+    }
+)
+
+LAUNCH_PARAMS_LIS: FrozenSet[str] = frozenset(
+    {
+        "lis_course_offering_sourcedid",
+        "lis_course_section_sourcedid",
+        "lis_outcome_service_url",
+        "lis_person_sourcedid",
+        "lis_result_sourcedid",
+    }
+)
+
+LAUNCH_PARAMS_RETURN_URL: FrozenSet[str] = frozenset(
+    {
+        "lti_errorlog",
+        "lti_errormsg",
+        "lti_log",
+        "lti_msg",
+    }
+)
+
+LAUNCH_PARAMS_OAUTH: FrozenSet[str] = frozenset(
+    {
+        "oauth_callback",
+        "oauth_consumer_key",
+        "oauth_nonce",
+        "oauth_signature",
+        "oauth_signature_method",
+        "oauth_timestamp",
+        "oauth_token",
+        "oauth_version",
+    }
+)
+
+LAUNCH_PARAMS_IS_LIST: FrozenSet[str] = frozenset(
+    {
+        "accept_media_types",
+        "accept_presentation_document_targets",
+        "context_type",
+        "role_scope_mentor",
+        "roles",
+    }
+)
+
+LAUNCH_PARAMS_CANVAS: FrozenSet[str] = frozenset({"selection_directive", "text"})
+
+CONTENT_PARAMS_REQUEST: FrozenSet[str] = frozenset(
+    {
+        "accept_copy_advice",
+        "accept_media_types",
+        "accept_multiple",
+        "accept_presentation_document_targets",
+        "accept_unsigned",
+        "auto_create",
+        "can_confirm",
+        "content_item_return_url",
+        "data",
+        "title",
+    }
+)
+
+CONTENT_PARAMS_RESPONSE: FrozenSet[str] = frozenset(
+    {
+        "content_items",
+        "lti_errorlog",
+        "lti_errormsg",
+        "lti_log",
+        "lti_msg",
+    }
+)
+
+REGISTRATION_PARAMS: FrozenSet[str] = frozenset(
+    {
+        "reg_key",
+        "reg_password",
+        "tc_profile_url",
+    }
+)
+
+LAUNCH_PARAMS: FrozenSet[str] = (
     CONTENT_PARAMS_REQUEST
     | CONTENT_PARAMS_RESPONSE
     | LAUNCH_PARAMS_CANVAS
@@ -139,22 +158,26 @@ LAUNCH_PARAMS = (
     | REGISTRATION_PARAMS
 )
 
-SELECTION_PARAMS_REQUIRED = {
-    "lti_message_type",
-    "lti_version",
-    "accept_media_types",
-    "accept_presentation_document_targets",
-    "content_item_return_url",
-}
-SELECTION_PARAMS_SHOULD_NOT_BE_PASSED = {
-    "resource_link_id",
-    "resource_link_title",
-    "resource_link_description",
-    "launch_presentation_return_url",
-    "lis_result_sourcedid",
-}
+SELECTION_PARAMS_REQUIRED: FrozenSet[str] = frozenset(
+    {
+        "lti_message_type",
+        "lti_version",
+        "accept_media_types",
+        "accept_presentation_document_targets",
+        "content_item_return_url",
+    }
+)
+SELECTION_PARAMS_SHOULD_NOT_BE_PASSED: FrozenSet[str] = frozenset(
+    {
+        "resource_link_id",
+        "resource_link_title",
+        "resource_link_description",
+        "launch_presentation_return_url",
+        "lis_result_sourcedid",
+    }
+)
 
-SELECTION_PARAMS = LAUNCH_PARAMS - SELECTION_PARAMS_SHOULD_NOT_BE_PASSED
+SELECTION_PARAMS: FrozenSet[str] = LAUNCH_PARAMS - SELECTION_PARAMS_SHOULD_NOT_BE_PASSED
 
 
 class ParamsMixin(MutableMapping):
@@ -164,36 +187,35 @@ class ParamsMixin(MutableMapping):
     enforces that params are valid LTI params.
     """
 
-    params_allowed: Set[str] = set()
-    params_required: Set[str] = set()
-    params_is_list: Set[str] = set()
+    params_allowed: FrozenSet[str] = frozenset()
+    params_required: FrozenSet[str] = frozenset()
+    params_is_list: FrozenSet[str] = frozenset()
 
     def __init__(self, *args, **kwargs):
 
-        self._params = dict()
-        self.update(*args, **kwargs)
+        if len(args) > 1:
+            raise TypeError(f"expected at most 1 argument, got {len(args):d}")
+        items = args[0] if args else ()
+        if isinstance(items, Mapping):
+            # items() also returns the last value of each key of a QueryDict
+            items = items.items()
+        params = dict(items, **kwargs)
 
-        # now verify we only got valid launch params
-        for k in self.keys():
-            if not self.valid_param(k):
-                raise InvalidParamException(k)
+        for key in sorted(params.keys() - self.params_allowed):
+            if not self.valid_param(key):
+                raise InvalidParamException(key)
 
-        for param in self.params_required:
-            if param not in self:
-                raise MissingParamException(param)
+        for key in self.params_is_list & params.keys():
+            if isinstance(params[key], list):
+                params[key] = ",".join([x.strip() for x in params[key]])
 
-    def _param_value(self, param: str) -> Union[str, List]:
-        """Get the value of an LTI parameter.
+        self._params = params
+        # Split values of list parameters, computed on first access
+        self._split_values = {}
 
-        Args:
-            param: LTI parameter name
-
-        Returns:
-            The value of the LTI parameter, as a str or a List, depending on the parameter.
-        """
-        if param in self.params_is_list:
-            return [x.strip() for x in self._params[param].split(",")]
-        return self._params[param]
+        missing = self.params_required - self._params.keys()
+        if missing:
+            raise MissingParamException(sorted(missing)[0])
 
     def valid_param(self, param: str) -> bool:
         """Checks if an LTI parameter is valid or not.
@@ -205,50 +227,79 @@ class ParamsMixin(MutableMapping):
             bool: True if the parameter is valid, False otherwise.
 
         """
-        if param.startswith("custom_") or param.startswith("ext_"):
+        if param in self.params_allowed:
             return True
-        return param in self.params_allowed
+        return param.startswith(("custom_", "ext_"))
 
     def __len__(self):
         return len(self._params)
 
     def __getitem__(self, item):
-        if not self.valid_param(item):
-            raise KeyError("{} is not a valid launch param".format(item))
+        """Get the value of an LTI parameter, as a str or a List, depending on the
+        parameter."""
         try:
-            return self._param_value(item)
+            value = self._params[item]
         except KeyError:
-            # catch and raise new KeyError in the proper context
-            raise KeyError(item)
+            # Stored keys are validated on insertion, only missing ones are checked here
+            if not self.valid_param(item):
+                raise KeyError("{} is not a valid launch param".format(item)) from None
+            raise KeyError(item) from None
+        if item in self.params_is_list:
+            split_value = self._split_values.get(item)
+            if split_value is None:
+                split_value = tuple(x.strip() for x in value.split(","))
+                self._split_values[item] = split_value
+            return list(split_value)
+        return value
 
     def __setitem__(self, key, value):
         if not self.valid_param(key):
             raise InvalidParamException(key)
-        if key in LAUNCH_PARAMS_IS_LIST:
+        if key in self.params_is_list:
             if isinstance(value, list):
                 value = ",".join([x.strip() for x in value])
         self._params[key] = value
+        self._split_values.pop(key, None)
+        self.__dict__.pop("urlencoded", None)
 
     def __delitem__(self, key):
         if key in self._params:
             del self._params[key]
+            self._split_values.pop(key, None)
+            self.__dict__.pop("urlencoded", None)
 
     def __iter__(self):
         return iter(self._params)
 
-    @property
+    def __contains__(self, key):
+        return key in self._params
+
+    def get(self, key, default=None):
+        """Get the value of an LTI parameter, or the default value if it is not set.
+
+        Overrides the MutableMapping implementation to avoid raising and catching
+        a KeyError for each missing parameter.
+        """
+        if key in self._params:
+            return self[key]
+        return default
+
+    @cached_property
     def urlencoded(self) -> str:
         """Get the URL encoded representation of the LTI parameter list.
 
+        It is computed once, until the parameters are modified.
+
         Returns:
             str: URL encoded LTI parameters
         """
-        params = dict(self)
         # stringify any list values
-        for key, value in params.items():
-            if isinstance(value, list):
-                params[key] = ",".join(value)
-        return urlencode(params)
+        return urlencode(
+            {
+                key: ",".join(value) if isinstance(value, list) else value
+                for key, value in self._params.items()
+            }
+        )
 
 
 class LaunchParams(ParamsMixin):  # pylint: disable=too-many-ancestors
@@ -1,7 +1,8 @@
 """LTI module that supports LTI 1.0."""
 
 import re
-from typing import Any, Optional, Set
+from functools import cached_property
+from typing import AbstractSet, Any, FrozenSet, Optional
 from urllib.parse import urljoin
 
 from oauthlib.oauth1 import SignatureOnlyEndpoint
@@ -17,24 +18,34 @@ from .launch_params import (
 from .models import LTIConsumer, LTIPassport
 from .validator import LTIRequestValidator
 
+EDX_CONTEXT_ID_REGEX = re.compile(r"^course-v[0-9]:(.*)$")
+
+STUDENT_ROLES = frozenset({LTIRole.STUDENT, LTIRole.LEARNER})
+INSTRUCTOR_ROLES = frozenset({LTIRole.INSTRUCTOR, LTIRole.TEACHER, LTIRole.STAFF})
+ADMINISTRATOR_ROLES = frozenset({LTIRole.ADMINISTRATOR})
+
 
 class LTI:
     """The LTI object abstracts an LTI request.
 
     It provides properties and methods to inspect a launch or selection request.
+    Properties derived from the LTI parameters are computed once per request.
     """
 
-    def __init__(self, request):
+    def __init__(self, request, validator: Optional[LTIRequestValidator] = None):
         """Initialize the LTI system.
 
         Args:
             request (HttpRequest) The request that holds the LTI parameters
+            validator (LTIRequestValidator) The validator used to verify the request,
+                a new one is instantiated if not provided
         """
 
         self.request = request
-        self._valid = None
-        self._params = {}
-        self._verified = False
+        self._validator = validator or LTIRequestValidator()
+        self._is_valid = False
+        # Set once the request is verified
+        self._params: Optional[ParamsMixin] = None
 
     def _process_params(self) -> ParamsMixin:
         """Process LTI parameters based on request type."""
@@ -63,23 +74,32 @@ class LTI:
             LTIException: Raised if request validation fails
         """
         params = self._process_params()
-        validator = LTIRequestValidator()
-        oauth_endpoint = SignatureOnlyEndpoint(validator)
+        oauth_endpoint = SignatureOnlyEndpoint(self._validator)
 
-        self._valid, _ = oauth_endpoint.validate_request(
+        # A form-encoded body is already the urlencoded form of the parameters.
+        # Undecodable bytes are replaced, the signature of such a body does not match.
+        if self.request.content_type == "application/x-www-form-urlencoded":
+            body = self.request.body.decode(
+                self.request.encoding or "utf-8", errors="replace"
+            )
+        else:
+            body = params.urlencoded
+
+        is_valid, _ = oauth_endpoint.validate_request(
             uri=self.request.build_absolute_uri(),
             http_method=self.request.method,
-            body=params.urlencoded,
+            body=body,
             headers=self.request.headers,
         )
 
-        if self._valid is not True:
+        if is_valid is not True:
+            self._is_valid = False
             raise LTIException("LTI verification failed")
 
         self._params = params
-        self._verified = True
+        self._is_valid = True
 
-        return self._valid
+        return True
 
     @property
     def is_valid(self) -> bool:
@@ -88,7 +108,7 @@ class LTI:
         Returns:
             True if the request is verified and valid
         """
-        return self._verified and self._valid
+        return self._is_valid
 
     def get_param(self, name: str, default: Any = None):
         """Retrieve an LTI parameter value given its name.
@@ -101,18 +121,23 @@ class LTI:
             The value of the LTI parameter if it exists, or the default value otherwise.
 
         """
-        if not self._verified:
+        if self._params is None:
             raise LTIRequestNotVerifiedException()
         return self._params.get(name, default)
 
-    def get_consumer(self) -> LTIConsumer:
-        """Retrieve the LTI consumer that initiated the request."""
+    @cached_property
+    def consumer(self) -> LTIConsumer:
+        """The LTI consumer that initiated the request."""
         consumer_key = self.get_param("oauth_consumer_key")
-        passport = LTIPassport.objects.get(
+        passport = LTIPassport.objects.select_related("consumer").get(
             oauth_consumer_key=consumer_key, is_enabled=True
         )
         return passport.consumer
 
+    def get_consumer(self) -> LTIConsumer:
+        """Retrieve the LTI consumer that initiated the request."""
+        return self.consumer
+
     def get_course_info(self) -> dict:
         """Retrieve course info in the LTI request.
 
@@ -124,7 +149,7 @@ class LTI:
 
         """
         if self.is_edx_format:
-            groups = re.match(r"^course-v[0-9]:(.*)", self.get_param("context_id"))
+            groups = EDX_CONTEXT_ID_REGEX.match(self.get_param("context_id"))
             if groups is not None:
                 part = groups.group(1).split("+")
                 length = len(part)
@@ -140,10 +165,10 @@ class LTI:
             "course_run": None,
         }
 
-    @property
+    @cached_property
     def origin_url(self):
         """Try to recreate the URL that was used to launch the LTI request."""
-        base_url = self.get_consumer().url
+        base_url = self.consumer.url
         if not base_url:
             return None
         if not base_url.endswith("/"):
@@ -158,17 +183,19 @@ class LTI:
 
         return url
 
-    @property
+    @cached_property
     def resource_link_title(self) -> Optional[str]:
         """Return the resource link id as default for its title."""
-        return self.get_param("resource_link_title", self.get_param("resource_link_id"))
+        title = self.get_param("resource_link_title")
+        return title if title is not None else self.get_param("resource_link_id")
 
-    @property
+    @cached_property
     def context_title(self) -> Optional[str]:
         """Return the context id as default for its title."""
-        return self.get_param("context_title", self.get_param("context_id"))
+        title = self.get_param("context_title")
+        return title if title is not None else self.get_param("context_id")
 
-    @property
+    @cached_property
     def roles(self):
         """LTI roles of the authenticated user.
 
@@ -178,7 +205,7 @@ class LTI:
         roles = self.get_param("roles", [])
         return list(map(str.lower, roles))
 
-    @property
+    @cached_property
     def is_edx_format(self):
         """Check if the LTI request comes from Open edX.
 
@@ -186,9 +213,9 @@ class LTI:
             boolean: True if the LTI request is sent by Open edX
 
         """
-        return re.search(r"^course-v[0-9]:.*$", self.get_param("context_id"))
+        return bool(EDX_CONTEXT_ID_REGEX.match(self.get_param("context_id") or ""))
 
-    @property
+    @cached_property
     def is_moodle_format(self):
         """Check if the LTI request comes from Moodle.
 
@@ -200,9 +227,14 @@ class LTI:
         """
         return self.get_param("tool_consumer_info_product_family_code", "") == "moodle"
 
-    def _has_any_of_roles(self, roles: Set[str]):
+    @cached_property
+    def _roles_set(self) -> FrozenSet[str]:
+        """Normalized LTI roles of the authenticated user, as a set."""
+        return frozenset(self.roles)
+
+    def _has_any_of_roles(self, roles: AbstractSet[str]):
         """Check if the LTI user has any of the provided roles."""
-        return not roles.isdisjoint(self.roles)
+        return not self._roles_set.isdisjoint(roles)
 
     @property
     def is_student(self):
@@ -212,7 +244,7 @@ class LTI:
             boolean: True if the LTI user is a student.
 
         """
-        return self._has_any_of_roles({LTIRole.STUDENT, LTIRole.LEARNER})
+        return self._has_any_of_roles(STUDENT_ROLES)
 
     @property
     def is_instructor(self):
@@ -222,9 +254,7 @@ class LTI:
             boolean: True if the LTI user is an instructor.
 
         """
-        return self._has_any_of_roles(
-            {LTIRole.INSTRUCTOR, LTIRole.TEACHER, LTIRole.STAFF}
-        )
+        return self._has_any_of_roles(INSTRUCTOR_ROLES)
 
     @property
     def is_administrator(self):
@@ -234,7 +264,7 @@ class LTI:
             boolean: True if the LTI user is an administrator.
 
         """
-        return self._has_any_of_roles({LTIRole.ADMINISTRATOR})
+        return self._has_any_of_roles(ADMINISTRATOR_ROLES)
 
     @property
     def can_edit_content(self):
@@ -2,10 +2,37 @@
 
 import secrets
 import string
+from itertools import islice
+from typing import List, Sequence, Tuple
 
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+CONSUMER_KEY_CHARS = string.ascii_uppercase + string.digits
+SHARED_SECRET_CHARS = string.ascii_letters + string.digits + "!#$%&*+-=?@^_"
+
+
+def _random_strings(chars: str, sizes: Sequence[int]) -> List[str]:
+    """Generate random strings of the given sizes, picking characters uniformly in `chars`.
+
+    Random bytes are fetched in bulk for all strings, bytes that would bias the modulo
+    are discarded.
+    """
+    count = len(chars)
+    limit = 256 - 256 % count
+    total_size = sum(sizes)
+    picked: List[str] = []
+    while len(picked) < total_size:
+        random_bytes = secrets.token_bytes(total_size - len(picked))
+        picked.extend(chars[byte % count] for byte in random_bytes if byte < limit)
+    picked_chars = iter(picked)
+    return ["".join(islice(picked_chars, size)) for size in sizes]
+
+
+def _random_string(chars: str, size: int) -> str:
+    """Generate a random string of `size` characters picked uniformly in `chars`."""
+    return _random_strings(chars, [size])[0]
+
 
 class LTIConsumer(models.Model):
     """
@@ -101,6 +128,8 @@ class LTIPassport(models.Model):
     def save(self, *args, **kwargs):
         """Generate the oauth consumer key and shared secret randomly upon creation.
 
+        The passport is validated upon creation only, updates are saved as is.
+
         Parameters
         ----------
         Args:
@@ -108,26 +137,67 @@ class LTIPassport(models.Model):
             dict (kwargs) : Passed onto parent's `save` method
 
         """
-        self.full_clean()
+        if self._state.adding:
+            self.full_clean()
+        self._ensure_keys()
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def bulk_create_passports(cls, passports):
+        """Validate passports and create them with a single INSERT.
+
+        The oauth consumer key and shared secret of each passport are generated if not
+        defined. Uniqueness is not checked beforehand, it is enforced by the database.
+
+        Args:
+            passports (iterable) The LTIPassport instances to create
+
+        Returns:
+            list: The created passports
+        """
+        passports = list(passports)
+        credentials = cls.generate_credentials_batch(len(passports))
+        for passport, (consumer_key, shared_secret) in zip(passports, credentials):
+            passport.full_clean(validate_unique=False)
+            if not passport.oauth_consumer_key:
+                passport.oauth_consumer_key = consumer_key
+            if not passport.shared_secret:
+                passport.shared_secret = shared_secret
+        return cls.objects.bulk_create(passports)
+
+    def _ensure_keys(self):
+        """Generate the oauth consumer key and shared secret if they are not defined."""
         if not self.oauth_consumer_key:
             self.oauth_consumer_key = self.generate_consumer_key()
         if not self.shared_secret:
             self.shared_secret = self.generate_shared_secret()
-        super().save(*args, **kwargs)
 
     @staticmethod
     def generate_consumer_key() -> str:
         """Generate a random consumer key."""
-        oauth_consumer_key_chars = string.ascii_uppercase + string.digits
-        oauth_consumer_key_size = secrets.choice(range(20, 30))
-        return "".join(
-            secrets.choice(oauth_consumer_key_chars)
-            for _ in range(oauth_consumer_key_size)
-        )
+        return _random_string(CONSUMER_KEY_CHARS, secrets.randbelow(10) + 20)
 
     @staticmethod
     def generate_shared_secret() -> str:
-        """Generate a random consumer key."""
-        secret_chars = string.ascii_letters + string.digits + "!#$%&*+-=?@^_"
-        secret_size = secrets.choice(range(40, 60))
-        return "".join(secrets.choice(secret_chars) for _ in range(secret_size))
+        """Generate a random shared secret."""
+        return _random_string(SHARED_SECRET_CHARS, secrets.randbelow(20) + 40)
+
+    @staticmethod
+    def generate_credentials_batch(count: int) -> List[Tuple[str, str]]:
+        """Generate random consumer keys and shared secrets for `count` passports.
+
+        Random bytes are fetched in bulk for all the credentials.
+
+        Args:
+            count (int) The number of credentials to generate
+
+        Returns:
+            list: (consumer key, shared secret) tuples
+        """
+        consumer_keys = _random_strings(
+            CONSUMER_KEY_CHARS, [secrets.randbelow(10) + 20 for _ in range(count)]
+        )
+        shared_secrets = _random_strings(
+            SHARED_SECRET_CHARS, [secrets.randbelow(20) + 40 for _ in range(count)]
+        )
+        return list(zip(consumer_keys, shared_secrets))
@@ -1,19 +1,20 @@
 """This module contains helpers for testing purpose"""
 
-from urllib.parse import unquote
-
 from oauthlib import oauth1
+from oauthlib.oauth1.rfc5849.utils import parse_authorization_header, unescape
 
 CONTENT_TYPE = "application/x-www-form-urlencoded"
 
 
-def sign_parameters(passport, lti_parameters, url):
+def sign_parameters(passport, lti_parameters, url, nonce=None, timestamp=None):
     """
 
     Args:
         passport: The LTIPassport to use to sign the oauth request
         lti_parameters: A dictionary of parameters to sign
         url: The LTI launch URL
+        nonce: The oauth nonce to use, a random one is generated if not provided
+        timestamp: The oauth timestamp to use, the current time if not provided
 
     Returns:
         dict: The signed parameters
@@ -21,7 +22,10 @@ def sign_parameters(passport, lti_parameters, url):
 
     signed_parameters = lti_parameters.copy()
     oauth_client = oauth1.Client(
-        client_key=passport.oauth_consumer_key, client_secret=passport.shared_secret
+        client_key=passport.oauth_consumer_key,
+        client_secret=passport.shared_secret,
+        nonce=nonce,
+        timestamp=timestamp,
     )
     # Compute Authorization header which looks like:
     # Authorization: OAuth oauth_nonce="80966668944732164491378916897",
@@ -35,13 +39,8 @@ def sign_parameters(passport, lti_parameters, url):
     )
 
     # Parse headers to pass to template as part of context:
-    oauth_dict = dict(
-        param.strip().replace('"', "").split("=")
-        for param in headers["Authorization"].split(",")
+    signed_parameters.update(
+        (key, unescape(value))
+        for key, value in parse_authorization_header(headers["Authorization"])
     )
-
-    signature = oauth_dict["oauth_signature"]
-    oauth_dict["oauth_signature"] = unquote(signature)
-    oauth_dict["oauth_nonce"] = oauth_dict.pop("OAuth oauth_nonce")
-    signed_parameters.update(oauth_dict)
     return signed_parameters
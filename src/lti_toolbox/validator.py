@@ -29,18 +29,84 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 
 """
+import hashlib
 import logging
+import re
 import time
+from typing import Dict, Optional
 
-from django.core.cache import InvalidCacheBackendError
-from django.core.cache import cache as default_cache
-from django.core.cache import caches
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.signals import setting_changed
 from oauthlib.oauth1 import RequestValidator
 
 from .models import LTIPassport
 
 logger = logging.getLogger(__name__)
 
+# Maximum length of the consumer key of an LTI passport
+CLIENT_KEY_MAX_LENGTH = 255
+
+# Replay protection keys matching this pattern are used without being hashed
+REPLAY_KEY_RAW_REGEX = re.compile(r"[A-Za-z0-9_.-]+:[0-9]+:[A-Za-z0-9_.-]+")
+REPLAY_KEY_RAW_MAX_LENGTH = 120
+
+# Cache aliases to use for replay protection, resolved once per configured alias
+_REPLAY_CACHE_ALIASES: Dict[str, str] = {}
+
+
+def _get_replay_cache_alias(alias: str) -> str:
+    """Return the alias of the replay protection cache, or the default cache alias.
+
+    Args:
+        alias: The alias of the cache configured for replay protection
+
+    Returns:
+        string: `alias` if such a cache is configured, the default cache alias otherwise
+    """
+    if alias not in _REPLAY_CACHE_ALIASES:
+        if alias in settings.CACHES:
+            _REPLAY_CACHE_ALIASES[alias] = alias
+        else:
+            logger.debug("Unable to find cache %s, fallback to default cache", alias)
+            _REPLAY_CACHE_ALIASES[alias] = DEFAULT_CACHE_ALIAS
+    return _REPLAY_CACHE_ALIASES[alias]
+
+
+def _build_replay_key(client_key: str, timestamp: str, nonce: str) -> str:
+    """Build the replay protection cache key of a client key, timestamp and nonce.
+
+    Short keys made of safe characters are used as is, others are hashed to a fixed
+    size so that they fit in any cache backend.
+
+    Args:
+        client_key: The client/consumer key.
+        timestamp: The ``oauth_timestamp`` request parameter.
+        nonce: The ``oauth_nonce`` request parameter.
+
+    Returns:
+        string: The cache key
+    """
+    raw_key = f"{client_key:s}:{timestamp:s}:{nonce:s}"
+    if (
+        len(raw_key) <= REPLAY_KEY_RAW_MAX_LENGTH
+        and REPLAY_KEY_RAW_REGEX.fullmatch(raw_key) is not None
+    ):
+        return f"LTI_TS_NONCE:{raw_key:s}"
+    key_digest = hashlib.blake2b(
+        f"{client_key:s}\x00{timestamp:s}\x00{nonce:s}".encode(), digest_size=16
+    ).hexdigest()
+    return f"LTI_TS_NONCE:{key_digest:s}"
+
+
+def _reset_replay_cache_aliases(setting, **kwargs):  # pylint: disable=unused-argument
+    """Resolve replay protection cache aliases again when the cache settings change."""
+    if setting == "CACHES":
+        _REPLAY_CACHE_ALIASES.clear()
+
+
+setting_changed.connect(_reset_replay_cache_aliases)
+
 
 class LTIRequestValidator(RequestValidator):
     """
@@ -90,13 +156,12 @@ class LTIRequestValidator(RequestValidator):
             request: The calling request.
         """
 
-        try:
-            passport = LTIPassport.objects.get(
-                oauth_consumer_key=client_key, is_enabled=True
-            )
-            return passport.shared_secret
-        except LTIPassport.DoesNotExist:
+        if client_key == self.dummy_client:
+            return "dummy_client_sec_123456"
+        shared_secret = self._get_shared_secret(client_key, request)
+        if shared_secret is None:
             return "dummy_client_sec_123456"
+        return shared_secret
 
     def validate_client_key(self, client_key, request):
         """Validates that supplied client key is a registered and valid client.
@@ -108,9 +173,37 @@ class LTIRequestValidator(RequestValidator):
         Returns:
             bool: True if the client key is registered and valid
         """
-        return LTIPassport.objects.filter(
-            oauth_consumer_key=client_key, is_enabled=True
-        ).exists()
+        return self._get_shared_secret(client_key, request) is not None
+
+    @staticmethod
+    def _get_shared_secret(client_key, request) -> Optional[str]:
+        """Fetch the shared secret of the enabled passport of a client key, once per request.
+
+        The client key is validated before the client secret is retrieved, both
+        steps share the secret fetched for the calling request.
+
+        Args:
+            client_key: The client/consumer key.
+            request: The calling request
+
+        Returns:
+            string: The shared secret, or None if no enabled passport uses the client key
+        """
+        shared_secrets = getattr(request, "lti_shared_secrets", None)
+        if shared_secrets is None:
+            shared_secrets = request.lti_shared_secrets = {}
+        if client_key not in shared_secrets:
+            try:
+                shared_secrets[client_key] = (
+                    LTIPassport.objects.filter(
+                        oauth_consumer_key=client_key, is_enabled=True
+                    )
+                    .values_list("shared_secret", flat=True)
+                    .get()
+                )
+            except LTIPassport.DoesNotExist:
+                shared_secrets[client_key] = None
+        return shared_secrets[client_key]
 
     # pylint: disable=too-many-arguments
     def validate_timestamp_and_nonce(
@@ -155,10 +248,21 @@ class LTIRequestValidator(RequestValidator):
             bool: True if the timestamp and nonce has not been used before
         """
 
+        # Reject client keys that no passport can match without using the cache
+        if not client_key or len(client_key) > CLIENT_KEY_MAX_LENGTH:
+            logger.debug("Invalid client key (consumer_key = %s)", client_key)
+            return False
+
+        try:
+            request_timestamp = int(timestamp)
+        except ValueError:
+            logger.debug("Invalid timestamp (ts = %s)", timestamp)
+            return False
+
         cache_timeout = 3600
+        now = int(time.time())
         # Disallow usage of timestamp older than cache_timeout
-        request_timestamp = int(timestamp)
-        if request_timestamp < int(time.time()) - cache_timeout:
+        if request_timestamp < now - cache_timeout:
             logger.debug(
                 "Timestamp is too old (ts = %s, consumer_key = %s, nonce = %s)",
                 timestamp,
@@ -167,18 +271,14 @@ class LTIRequestValidator(RequestValidator):
             )
             return False
 
-        try:
-            cache = caches[self.LTI_REPLAY_PROTECTION_CACHE]
-        except InvalidCacheBackendError:
-            logger.debug(
-                "Unable to find cache %s, fallback to default cache",
-                self.LTI_REPLAY_PROTECTION_CACHE,
-            )
-            cache = default_cache
+        cache = caches[_get_replay_cache_alias(self.LTI_REPLAY_PROTECTION_CACHE)]
+
+        key = _build_replay_key(client_key, timestamp, nonce)
 
-        key = f"LTI_TS_NONCE:{client_key:s}:{timestamp:s}:{nonce:s}"
+        # The nonce only has to be kept until its timestamp is too old to be accepted
+        nonce_timeout = max(1, request_timestamp + cache_timeout - now)
 
-        if not cache.add(key, "1", cache_timeout):
+        if not cache.add(key, "1", nonce_timeout):
             logger.warning(
                 "Replayed timestamp/nonce detected (ts = %s, consumer_key = %s, nonce = %s)",
                 timestamp,
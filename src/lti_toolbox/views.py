@@ -3,16 +3,15 @@ from abc import ABC, abstractmethod
 
 from django.contrib.auth import authenticate, login
 from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
-from django.utils.decorators import method_decorator
 from django.views import View
 from django.views.decorators.csrf import csrf_exempt
 
 from lti_toolbox.exceptions import LTIException
 
 from .lti import LTI
+from .validator import LTIRequestValidator
 
 
-@method_decorator(csrf_exempt, name="dispatch")
 class BaseLTIView(ABC, View):
     """
     Abstract view for handling views from an LTI request.
@@ -22,9 +21,17 @@ class BaseLTIView(ABC, View):
     processing of successful LTI requests.
     """
 
+    # The validator holds no state, a single instance is shared by all requests
+    lti_request_validator = LTIRequestValidator()
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """LTI requests are posted by the consumer website, without a CSRF token."""
+        return csrf_exempt(super().as_view(**initkwargs))
+
     def post(self, request, *args, **kwargs) -> HttpResponse:  # pylint: disable=W0613
         """Handler for POST requests."""
-        lti_request = LTI(request)
+        lti_request = LTI(request, validator=self.lti_request_validator)
         try:
             lti_request.verify()
             return self._do_on_success(lti_request, *args, **kwargs)
@@ -46,7 +53,6 @@ class BaseLTIView(ABC, View):
         return HttpResponseForbidden("Invalid LTI request")
 
 
-@method_decorator(csrf_exempt, name="dispatch")
 class BaseLTIAuthView(ABC, View):
     """
     Abstract view for handling authenticated views from an LTI request.
@@ -57,9 +63,17 @@ class BaseLTIAuthView(ABC, View):
     processing of authenticated users via LTI.
     """
 
+    # The validator holds no state, a single instance is shared by all requests
+    lti_request_validator = LTIRequestValidator()
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        """LTI requests are posted by the consumer website, without a CSRF token."""
+        return csrf_exempt(super().as_view(**initkwargs))
+
     def post(self, request, *args, **kwargs) -> HttpResponse:  # pylint: disable=W0613
         """Handler for POST requests."""
-        lti_request = LTI(request)
+        lti_request = LTI(request, validator=self.lti_request_validator)
         try:
             lti_request.verify()
             user = authenticate(request, lti_request=lti_request)
@@ -1,11 +1,78 @@
 """Test the LTI Launch parameters validator."""
 
+from types import MappingProxyType
+
 from django.test import RequestFactory, TestCase
 
 from lti_toolbox.exceptions import InvalidParamException, MissingParamException
 from lti_toolbox.factories import LTIConsumerFactory, LTIPassportFactory
 from lti_toolbox.launch_params import LaunchParams, SelectionParams
-from lti_toolbox.utils import sign_parameters
+
+from .utils import fake_sign_parameters
+
+# Parameters of a standard LTI launch request sent by Open edX
+STANDARD_LAUNCH_PARAMETERS = MappingProxyType(
+    {
+        "resource_link_id": "test-lms-3d09baddc21a365b7da5ae4d0aa5cb95",
+        "lis_person_contact_email_primary": "jean-michel.test@example.com",
+        "user_id": "cc09206e612fbdd5636f845dbf9676b3",
+        "roles": "Instructor",
+        "lis_result_sourcedid": "course-v1%3Atest%2B41018%2Bsession01:test-lms"
+        "-3d09baddc21a365b7da5ae4d0aa5cb95:cc09206e612fbdd5636f845dbf9676b3",
+        "context_id": "course-v1:test+41018+session01",
+        "lti_version": "LTI-1p0",
+        "launch_presentation_return_url": "",
+        "lis_person_sourcedid": "jeanmich-t",
+        "lti_message_type": "basic-lti-launch-request",
+    }
+)
+
+# Parameters of a standard LTI Content-Item Selection request sent by Moodle
+STANDARD_SELECTION_PARAMETERS = MappingProxyType(
+    {
+        "oauth_version": "1.0",
+        "oauth_nonce": "fac452792511fd88c173f2208c1ad3c9",
+        "oauth_timestamp": "1649681644",
+        "oauth_consumer_key": "A9H5YBAYNERTBIBVEQS4",
+        "user_id": "2",
+        "lis_person_sourcedid": "",
+        "roles": "Instructor",
+        "context_id": "2",
+        "context_label": "My first course",
+        "context_title": "My first course",
+        "context_type": "CourseSection",
+        "lis_course_section_sourcedid": "",
+        "lis_person_name_given": "Admin",
+        "lis_person_name_family": "User",
+        "lis_person_name_full": "Admin User",
+        "ext_user_username": "admin",
+        "lis_person_contact_email_primary": "demo@moodle.a",
+        "launch_presentation_locale": "en",
+        "ext_lms": "moodle-2",
+        "tool_consumer_info_product_family_code": "moodle",
+        "tool_consumer_info_version": "2021051706",
+        "oauth_callback": "about:blank",
+        "lti_version": "LTI-1p0",
+        "lti_message_type": "ContentItemSelectionRequest",
+        "tool_consumer_instance_guid": "1f60aaf6991f55818465e52f3d2879b7",
+        "tool_consumer_instance_name": "Sandbox",
+        "tool_consumer_instance_description": "Moodle sandbox demo",
+        "accept_media_types": "application/vnd.ims.lti.v1.ltilink",
+        "accept_presentation_document_targets": "frame,iframe,window",
+        "accept_copy_advice": "false",
+        "accept_multiple": "true",
+        "accept_unsigned": "false",
+        "auto_create": "false",
+        "can_confirm": "false",
+        "content_item_return_url": "https://woop.com",
+        "title": (
+            "Marsha LTI provider (never empty : fallback to moodle external tool name)"
+        ),
+        "text": "(current activity description if exists)",
+        "oauth_signature_method": "HMAC-SHA1",
+        "oauth_signature": "GEetrp41W4gCH5m1Fe6RPhf55W4=",
+    }
+)
 
 
 class LaunchParamTestCase(TestCase):
@@ -16,12 +83,19 @@ class LaunchParamTestCase(TestCase):
         super().setUp()
         self.request_factory = RequestFactory()
 
-    @staticmethod
-    def _launch_params(lti_parameters):
+    @classmethod
+    def setUpTestData(cls):
+        """Create the passport used to sign parameters once for all tests."""
+        super().setUpTestData()
         consumer = LTIConsumerFactory(slug="test_launch_params")
-        passport = LTIPassportFactory(title="test passport", consumer=consumer)
-        url = "http://testserver/lti/launch"
-        signed_parameters = sign_parameters(passport, lti_parameters, url)
+        cls._passport = LTIPassportFactory(title="test passport", consumer=consumer)
+        cls._url = "http://testserver/lti/launch"
+
+    def _launch_params(self, lti_parameters):
+        # The signature is not verified, parameters only need to look signed
+        signed_parameters = fake_sign_parameters(
+            self._passport, lti_parameters, self._url
+        )
         return LaunchParams(signed_parameters)
 
     def test_only_required_parameters(self):
@@ -38,43 +112,22 @@ class LaunchParamTestCase(TestCase):
     def test_missing_parameters(self):
         """Test missing required parameters."""
 
-        with self.assertRaises(MissingParamException):
-            self._launch_params(
-                {
-                    "lti_message_type": "basic-lti-launch-request",
-                    "resource_link_id": "df7",
-                }
-            )
-
-        with self.assertRaises(MissingParamException):
-            self._launch_params(
-                {
-                    "lti_message_type": "basic-lti-launch-request",
-                    "lti_version": "LTI-1p0",
-                }
-            )
-
-        with self.assertRaises(MissingParamException):
-            self._launch_params({"lti_version": "LTI-1p0", "resource_link_id": "df7"})
+        required_parameters = {
+            "lti_message_type": "basic-lti-launch-request",
+            "lti_version": "LTI-1p0",
+            "resource_link_id": "df7",
+        }
+        for missing_parameter in required_parameters:
+            with self.subTest(missing_parameter=missing_parameter):
+                lti_parameters = required_parameters.copy()
+                del lti_parameters[missing_parameter]
+                with self.assertRaises(MissingParamException):
+                    self._launch_params(lti_parameters)
 
     def test_standard_request(self):
         """Test standard LTI launch request."""
 
-        self._launch_params(
-            {
-                "resource_link_id": "test-lms-3d09baddc21a365b7da5ae4d0aa5cb95",
-                "lis_person_contact_email_primary": "jean-michel.test@example.com",
-                "user_id": "cc09206e612fbdd5636f845dbf9676b3",
-                "roles": "Instructor",
-                "lis_result_sourcedid": "course-v1%3Atest%2B41018%2Bsession01:test-lms"
-                "-3d09baddc21a365b7da5ae4d0aa5cb95:cc09206e612fbdd5636f845dbf9676b3",
-                "context_id": "course-v1:test+41018+session01",
-                "lti_version": "LTI-1p0",
-                "launch_presentation_return_url": "",
-                "lis_person_sourcedid": "jeanmich-t",
-                "lti_message_type": "basic-lti-launch-request",
-            }
-        )
+        self._launch_params(STANDARD_LAUNCH_PARAMETERS)
 
     def test_custom_parameters(self):
         """Test LTI launch request with additional custom launch parameters."""
@@ -114,6 +167,15 @@ class LaunchParamTestCase(TestCase):
         )
         self.assertEqual(expected, launch_params.urlencoded)
 
+        # The urlencoded representation follows updates of the parameters
+        launch_params["context_id"] = "course-v1:fooschool+mathematics+0042"
+        self.assertEqual(
+            f"{expected}&context_id=course-v1%3Afooschool%2Bmathematics%2B0042",
+            launch_params.urlencoded,
+        )
+        del launch_params["context_id"]
+        self.assertEqual(expected, launch_params.urlencoded)
+
     def test_invalid_parameter(self):
         """Test behavior with invalid parameter in LTI launch request."""
         with self.assertRaises(InvalidParamException):
@@ -135,12 +197,19 @@ class SelectionParamTestCase(TestCase):
         super().setUp()
         self.request_factory = RequestFactory()
 
-    @staticmethod
-    def _selection_params(lti_parameters):
+    @classmethod
+    def setUpTestData(cls):
+        """Create the passport used to sign parameters once for all tests."""
+        super().setUpTestData()
         consumer = LTIConsumerFactory(slug="test_launch_params")
-        passport = LTIPassportFactory(title="test passport", consumer=consumer)
-        url = "http://testserver/lti/launch"
-        signed_parameters = sign_parameters(passport, lti_parameters, url)
+        cls._passport = LTIPassportFactory(title="test passport", consumer=consumer)
+        cls._url = "http://testserver/lti/launch"
+
+    def _selection_params(self, lti_parameters):
+        # The signature is not verified, parameters only need to look signed
+        signed_parameters = fake_sign_parameters(
+            self._passport, lti_parameters, self._url
+        )
         return SelectionParams(signed_parameters)
 
     def test_only_required_parameters(self):
@@ -161,84 +230,24 @@ class SelectionParamTestCase(TestCase):
     def test_missing_parameters(self):
         """Test missing required parameters."""
 
-        with self.assertRaises(MissingParamException):
-            self._selection_params(
-                {
-                    "lti_message_type": "ContentItemSelectionRequest",
-                    "lti_version": "LTI-1p0",
-                    "accept_media_types": "application/vnd.ims.lti.v1.ltilink",
-                    "accept_presentation_document_targets": "frame,iframe,window",
-                }
-            )
-
-        with self.assertRaises(MissingParamException):
-            self._selection_params(
-                {
-                    "lti_version": "LTI-1p0",
-                    "accept_media_types": "application/vnd.ims.lti.v1.ltilink",
-                    "accept_presentation_document_targets": "frame,iframe,window",
-                    "content_item_return_url": "http://test/",
-                }
-            )
-
-        with self.assertRaises(MissingParamException):
-            self._selection_params(
-                {
-                    "lti_message_type": "ContentItemSelectionRequest",
-                    "accept_media_types": "application/vnd.ims.lti.v1.ltilink",
-                    "accept_presentation_document_targets": "frame,iframe,window",
-                    "content_item_return_url": "http://test/",
-                }
-            )
+        required_parameters = {
+            "lti_message_type": "ContentItemSelectionRequest",
+            "lti_version": "LTI-1p0",
+            "accept_media_types": "application/vnd.ims.lti.v1.ltilink",
+            "accept_presentation_document_targets": "frame,iframe,window",
+            "content_item_return_url": "http://test/",
+        }
+        for missing_parameter in required_parameters:
+            with self.subTest(missing_parameter=missing_parameter):
+                lti_parameters = required_parameters.copy()
+                del lti_parameters[missing_parameter]
+                with self.assertRaises(MissingParamException):
+                    self._selection_params(lti_parameters)
 
     def test_standard_request(self):
         """Test standard LTI Content-Item Selection request."""
 
-        self._selection_params(
-            {
-                "oauth_version": "1.0",
-                "oauth_nonce": "fac452792511fd88c173f2208c1ad3c9",
-                "oauth_timestamp": "1649681644",
-                "oauth_consumer_key": "A9H5YBAYNERTBIBVEQS4",
-                "user_id": "2",
-                "lis_person_sourcedid": "",
-                "roles": "Instructor",
-                "context_id": "2",
-                "context_label": "My first course",
-                "context_title": "My first course",
-                "context_type": "CourseSection",
-                "lis_course_section_sourcedid": "",
-                "lis_person_name_given": "Admin",
-                "lis_person_name_family": "User",
-                "lis_person_name_full": "Admin User",
-                "ext_user_username": "admin",
-                "lis_person_contact_email_primary": "demo@moodle.a",
-                "launch_presentation_locale": "en",
-                "ext_lms": "moodle-2",
-                "tool_consumer_info_product_family_code": "moodle",
-                "tool_consumer_info_version": "2021051706",
-                "oauth_callback": "about:blank",
-                "lti_version": "LTI-1p0",
-                "lti_message_type": "ContentItemSelectionRequest",
-                "tool_consumer_instance_guid": "1f60aaf6991f55818465e52f3d2879b7",
-                "tool_consumer_instance_name": "Sandbox",
-                "tool_consumer_instance_description": "Moodle sandbox demo",
-                "accept_media_types": "application/vnd.ims.lti.v1.ltilink",
-                "accept_presentation_document_targets": "frame,iframe,window",
-                "accept_copy_advice": "false",
-                "accept_multiple": "true",
-                "accept_unsigned": "false",
-                "auto_create": "false",
-                "can_confirm": "false",
-                "content_item_return_url": "https://woop.com",
-                "title": (
-                    "Marsha LTI provider (never empty : fallback to moodle external tool name)"
-                ),
-                "text": "(current activity description if exists)",
-                "oauth_signature_method": "HMAC-SHA1",
-                "oauth_signature": "GEetrp41W4gCH5m1Fe6RPhf55W4=",
-            }
-        )
+        self._selection_params(STANDARD_SELECTION_PARAMETERS)
 
     def test_urlencoded(self):
         """Test urlencoded representation of an LTI launch request."""
@@ -1,5 +1,6 @@
 """Test the LTI interconnection with an LTI consumer."""
 
+from unittest import mock
 from urllib.parse import urlencode
 
 from django.test import RequestFactory, TestCase
@@ -9,25 +10,44 @@ from lti_toolbox.factories import LTIConsumerFactory, LTIPassportFactory
 from lti_toolbox.launch_params import LTIRole
 from lti_toolbox.lti import LTI
 from lti_toolbox.utils import CONTENT_TYPE, sign_parameters
+from lti_toolbox.validator import LTIRequestValidator
 
+from .utils import fake_sign_parameters
 
-class LTITestCase(TestCase):
-    """Test the LTI class"""
+
+class BaseLTITestCase(TestCase):
+    """Base test case to build LTI requests signed with a test passport"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the consumer and passport used to sign requests once for all tests."""
+        super().setUpTestData()
+        cls._consumer = LTIConsumerFactory(
+            slug="test_lti", url="https://testserver/consumer"
+        )
+        cls._passport = LTIPassportFactory(
+            title="test passport", consumer=cls._consumer
+        )
+        cls._url = "http://testserver/lti/launch"
 
     def setUp(self):
         """Override the setUp method to instantiate and serve a request factory."""
         super().setUp()
         self.request_factory = RequestFactory()
-        self._consumer = LTIConsumerFactory(slug="test_lti")
-        self._passport = LTIPassportFactory(
-            title="test passport", consumer=self._consumer
-        )
-        self._url = "http://testserver/lti/launch"
 
     def _verified_lti_request(self, lti_parameters):
-        signed_parameters = sign_parameters(self._passport, lti_parameters, self._url)
+        """Build an LTI request whose parameters are trusted as if it was verified.
+
+        The signature verification is tested on its own, other tests only need the
+        parameters to be processed.
+        """
+        signed_parameters = fake_sign_parameters(
+            self._passport, lti_parameters, self._url
+        )
         lti = self._lti_request(signed_parameters, self._url)
-        lti.verify()
+        # pylint: disable=protected-access
+        lti._params = lti._process_params()
+        lti._is_valid = True
         return lti
 
     def _lti_request(self, signed_parameters, url):
@@ -38,6 +58,10 @@ class LTITestCase(TestCase):
         )
         return LTI(request)
 
+
+class LTIVerifyTestCase(BaseLTITestCase):
+    """Test the verification of LTI requests"""
+
     def test_verify_signature(self):
         """Test the oauth 1.0 signature verification"""
 
@@ -52,18 +76,99 @@ class LTITestCase(TestCase):
         signed_parameters = sign_parameters(self._passport, lti_parameters, self._url)
         lti = self._lti_request(signed_parameters, self._url)
         self.assertFalse(lti.is_valid)
-        self.assertTrue(lti.verify())
+        # The passport is fetched once to validate the key and sign the request
+        with self.assertNumQueries(1):
+            self.assertTrue(lti.verify())
         self.assertTrue(lti.is_valid)
 
-        # If we alter the signature (e.g. add "a" to it), the verification should fail
-        signed_parameters["oauth_signature"] = "{:s}a".format(
-            signed_parameters["oauth_signature"]
-        )
-        lti = self._lti_request(signed_parameters, self._url)
+        # If we alter the signature (e.g. add "a" to it), the verification should fail.
+        # Parameters are signed again so that the request is not rejected as a replay.
+        tampered_parameters = sign_parameters(self._passport, lti_parameters, self._url)
+        tampered_parameters["oauth_signature"] += "a"
+        lti = self._lti_request(tampered_parameters, self._url)
         with self.assertRaises(LTIException):
             self.assertFalse(lti.verify())
         self.assertFalse(lti.is_valid)
 
+    def test_verify_signature_special_characters(self):
+        """Test the verification of values with lists and special characters"""
+
+        lti_parameters = {
+            "lti_message_type": "basic-lti-launch-request",
+            "lti_version": "LTI-1p0",
+            "resource_link_id": "df7",
+            "resource_link_title": "Week 1 / Lesson 2 (50%)",
+            "context_id": "course-v1:fooschool+mathematics+0042",
+            "context_title": "Mathématiques & physique: l'été",
+            "roles": "Student,Moderator",
+            "lis_person_sourcedid": "jane+doe@example.com",
+        }
+
+        signed_parameters = sign_parameters(self._passport, lti_parameters, self._url)
+        lti = self._lti_request(signed_parameters, self._url)
+        self.assertTrue(lti.verify())
+
+        self.assertEqual(["student", "moderator"], lti.roles)
+        self.assertEqual(
+            (False, False, True),
+            (lti.is_instructor, lti.is_administrator, lti.is_student),
+        )
+        self.assertTrue(lti.is_edx_format)
+        self.assertEqual(
+            {
+                "school_name": "fooschool",
+                "course_name": "mathematics",
+                "course_run": "0042",
+            },
+            lti.get_course_info(),
+        )
+        self.assertEqual("Week 1 / Lesson 2 (50%)", lti.resource_link_title)
+        self.assertEqual("Mathématiques & physique: l'été", lti.context_title)
+        self.assertEqual("jane+doe@example.com", lti.get_param("lis_person_sourcedid"))
+
+    def test_verify_with_validator(self):
+        """The validator given to the LTI object should be used to verify the request"""
+
+        lti_parameters = {
+            "lti_message_type": "basic-lti-launch-request",
+            "lti_version": "LTI-1p0",
+            "resource_link_id": "df7",
+        }
+
+        signed_parameters = sign_parameters(self._passport, lti_parameters, self._url)
+        request = self.request_factory.post(
+            self._url,
+            data=urlencode(signed_parameters),
+            content_type=CONTENT_TYPE,
+        )
+        validator = LTIRequestValidator()
+        lti = LTI(request, validator=validator)
+        with mock.patch.object(
+            validator, "get_client_secret", wraps=validator.get_client_secret
+        ) as mock_get_client_secret:
+            self.assertTrue(lti.verify())
+        mock_get_client_secret.assert_called_once()
+
+    def test_verify_disabled_passport(self):
+        """The verification of a request signed with a disabled passport should fail"""
+
+        lti_parameters = {
+            "lti_message_type": "basic-lti-launch-request",
+            "lti_version": "LTI-1p0",
+            "resource_link_id": "df7",
+        }
+
+        signed_parameters = sign_parameters(self._passport, lti_parameters, self._url)
+        self._passport.is_enabled = False
+        self._passport.save()
+
+        lti = self._lti_request(signed_parameters, self._url)
+        # As many queries as for an enabled passport
+        with self.assertNumQueries(1):
+            with self.assertRaises(LTIException):
+                lti.verify()
+        self.assertFalse(lti.is_valid)
+
     def test_replay_attack(self):
         """Test a replay attack"""
 
@@ -83,6 +188,10 @@ class LTITestCase(TestCase):
         with self.assertRaises(LTIException):
             self.assertFalse(replayed_lti.verify())
 
+
+class LTITestCase(BaseLTITestCase):
+    """Test the LTI class"""
+
     def test_invalid_param(self):
         """Test the behaviour of LTI verification when an invalid LTI parameter is given"""
 
@@ -125,7 +234,9 @@ class LTITestCase(TestCase):
                 "resource_link_id": "df7",
             }
         )
-        self.assertEqual(self._consumer.slug, lti.get_consumer().slug)
+        with self.assertNumQueries(1):
+            self.assertEqual(self._consumer.slug, lti.get_consumer().slug)
+            self.assertEqual(self._consumer.slug, lti.consumer.slug)
 
     def test_is_edx_format(self):
         """Test the detection of EdX course format"""
@@ -143,6 +254,10 @@ class LTITestCase(TestCase):
         lti = self._verified_lti_request(lti_parameters)
         self.assertFalse(lti.is_edx_format)
 
+        del lti_parameters["context_id"]
+        lti = self._verified_lti_request(lti_parameters)
+        self.assertFalse(lti.is_edx_format)
+
     def test_is_moodle_format(self):
         """Test the detection of Moodle course format"""
         lti_parameters = {
@@ -173,20 +288,28 @@ class LTITestCase(TestCase):
             "roles": "Instructor",
         }
         lti = self._verified_lti_request(lti_parameters)
-        course_info = lti.get_course_info()
-        self.assertEqual("fooschool", course_info.get("school_name"))
-        self.assertEqual("mathematics", course_info.get("course_name"))
-        self.assertEqual("0042", course_info.get("course_run"))
+        self.assertEqual(
+            {
+                "school_name": "fooschool",
+                "course_name": "mathematics",
+                "course_run": "0042",
+            },
+            lti.get_course_info(),
+        )
 
         # Non-EdX request
         lti_parameters.update(
             {"context_id": "foo-context", "tool_consumer_instance_name": "bar-school"}
         )
         lti = self._verified_lti_request(lti_parameters)
-        course_info = lti.get_course_info()
-        self.assertEqual("bar-school", course_info.get("school_name"))
-        self.assertEqual("some context", course_info.get("course_name"))
-        self.assertIsNone(course_info.get("course_run"))
+        self.assertEqual(
+            {
+                "school_name": "bar-school",
+                "course_name": "some context",
+                "course_run": None,
+            },
+            lti.get_course_info(),
+        )
 
     def test_resource_link_title(self):
         """Test the retrieval of the resource_link_title"""
@@ -255,9 +378,10 @@ class LTITestCase(TestCase):
                 "roles": "Instructor",
             }
         )
-        self.assertTrue(lti.is_instructor)
-        self.assertFalse(lti.is_administrator)
-        self.assertFalse(lti.is_student)
+        self.assertEqual(
+            (True, False, False),
+            (lti.is_instructor, lti.is_administrator, lti.is_student),
+        )
 
         lti = self._verified_lti_request(
             {
@@ -267,9 +391,10 @@ class LTITestCase(TestCase):
                 "roles": "Student,Moderator",
             }
         )
-        self.assertFalse(lti.is_instructor)
-        self.assertFalse(lti.is_administrator)
-        self.assertTrue(lti.is_student)
+        self.assertEqual(
+            (False, False, True),
+            (lti.is_instructor, lti.is_administrator, lti.is_student),
+        )
 
         lti = self._verified_lti_request(
             {
@@ -279,9 +404,10 @@ class LTITestCase(TestCase):
                 "roles": "Administrator,Instructor",
             }
         )
-        self.assertTrue(lti.is_instructor)
-        self.assertTrue(lti.is_administrator)
-        self.assertFalse(lti.is_student)
+        self.assertEqual(
+            (True, True, False),
+            (lti.is_instructor, lti.is_administrator, lti.is_student),
+        )
 
         lti = self._verified_lti_request(
             {
@@ -291,9 +417,10 @@ class LTITestCase(TestCase):
                 "roles": "WrongRole",
             }
         )
-        self.assertFalse(lti.is_instructor)
-        self.assertFalse(lti.is_administrator)
-        self.assertFalse(lti.is_student)
+        self.assertEqual(
+            (False, False, False),
+            (lti.is_instructor, lti.is_administrator, lti.is_student),
+        )
 
     def test_can_edit_content(self):
         """Test can_edit_content property"""
@@ -366,7 +493,7 @@ class LTITestCase(TestCase):
 
         self.assertEqual(
             lti.origin_url,
-            "https://testserver/consumer-20/course/course-v1:fooschool+mathematics+0042",
+            "https://testserver/consumer/course/course-v1:fooschool+mathematics+0042",
         )
 
     def test_lti_origin_url_moodle(self):
@@ -382,5 +509,5 @@ class LTITestCase(TestCase):
         lti = self._verified_lti_request(lti_parameters)
 
         self.assertEqual(
-            lti.origin_url, "https://testserver/consumer-21/course/view.php?id=123"
+            lti.origin_url, "https://testserver/consumer/course/view.php?id=123"
         )
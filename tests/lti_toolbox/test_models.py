@@ -1,4 +1,6 @@
 """Test the lti_toolbox models"""
+from unittest import mock
+
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
@@ -9,29 +11,41 @@ from lti_toolbox.models import LTIPassport
 class LTIPassportTestCase(TestCase):
     """Test the LTIPassport class."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Create the consumer of the passports once for all tests."""
+        super().setUpTestData()
+        cls._consumer = LTIConsumerFactory(slug="test_lti_passport")
+
     def test_generate_consumer_key(self):
         """Basic testing of entropy in the consumer key generator."""
-        generated_keys = set()
+        consumer_keys = [LTIPassport.generate_consumer_key() for _ in range(99)]
         # basic testing for entropy
-        for _ in range(1, 100):
-            consumer_key = LTIPassport.generate_consumer_key()
-            self.assertFalse(consumer_key in generated_keys)
-            self.assertGreaterEqual(len(consumer_key), 20)
-            generated_keys.add(consumer_key)
+        self.assertEqual(len(consumer_keys), len(set(consumer_keys)))
+        self.assertGreaterEqual(min(map(len, consumer_keys)), 20)
 
     def test_generate_secret(self):
         """Basic testing of entropy in the shared secret generator."""
-        generated_secret = set()
-        for _ in range(1, 100):
-            secret = LTIPassport.generate_shared_secret()
-            self.assertFalse(secret in generated_secret)
-            self.assertGreaterEqual(len(secret), 40)
-            generated_secret.add(secret)
+        secrets = [LTIPassport.generate_shared_secret() for _ in range(99)]
+        self.assertEqual(len(secrets), len(set(secrets)))
+        self.assertGreaterEqual(min(map(len, secrets)), 40)
+
+    def test_generate_credentials_batch(self):
+        """Basic testing of entropy in the credentials batch generator."""
+        credentials = LTIPassport.generate_credentials_batch(100)
+        self.assertEqual(100, len(credentials))
+        consumer_keys, shared_secrets = zip(*credentials)
+        self.assertEqual(100, len(set(consumer_keys)))
+        self.assertEqual(100, len(set(shared_secrets)))
+        for consumer_key, shared_secret in credentials:
+            self.assertTrue(20 <= len(consumer_key) < 30)
+            self.assertTrue(40 <= len(shared_secret) < 60)
 
     def test_generate_keys_on_save(self):
         """Ensure that a shared secret and a consumer key are generated on save() if not defined"""
-        consumer = LTIConsumerFactory(slug="test_generate_keys_on_save")
-        passport = LTIPassport(title="test_generate_keys_on_save_p1", consumer=consumer)
+        passport = LTIPassport(
+            title="test_generate_keys_on_save_p1", consumer=self._consumer
+        )
         self.assertEqual("", passport.shared_secret)
         self.assertEqual("", passport.oauth_consumer_key)
         passport.save()
@@ -42,7 +56,7 @@ class LTIPassportTestCase(TestCase):
 
         passport2 = LTIPassport(
             title="test_generate_keys_on_save_p2",
-            consumer=consumer,
+            consumer=self._consumer,
             oauth_consumer_key="custom_consumer_key",
         )
         self.assertEqual("", passport2.shared_secret)
@@ -53,7 +67,7 @@ class LTIPassportTestCase(TestCase):
 
         passport3 = LTIPassport(
             title="test_generate_keys_on_save_p3",
-            consumer=consumer,
+            consumer=self._consumer,
             shared_secret="custom_secret",
         )
         self.assertEqual("", passport3.oauth_consumer_key)
@@ -64,7 +78,7 @@ class LTIPassportTestCase(TestCase):
 
         passport4 = LTIPassport(
             title="test_generate_keys_on_save_p4",
-            consumer=consumer,
+            consumer=self._consumer,
             oauth_consumer_key="consumer_key",
             shared_secret="custom_secret",
         )
@@ -72,6 +86,49 @@ class LTIPassportTestCase(TestCase):
         self.assertEqual("consumer_key", passport4.oauth_consumer_key)
         self.assertEqual("custom_secret", passport4.shared_secret)
 
+    def test_full_clean_on_create_only(self):
+        """A passport should be validated when it is created, not when it is updated"""
+        passport = LTIPassport(
+            title="test_full_clean_on_create_only", consumer=self._consumer
+        )
+        with mock.patch.object(
+            LTIPassport, "full_clean", autospec=True, side_effect=LTIPassport.full_clean
+        ) as mock_full_clean:
+            passport.save()
+            mock_full_clean.assert_called_once_with(passport)
+
+            mock_full_clean.reset_mock()
+            passport.is_enabled = False
+            passport.save()
+            mock_full_clean.assert_not_called()
+
+    def test_bulk_create_passports(self):
+        """Passports should be validated and created with their keys in a single INSERT"""
+        # Validating each passport checks that its consumer exists, then one INSERT
+        with self.assertNumQueries(3):
+            passports = LTIPassport.bulk_create_passports(
+                [
+                    LTIPassport(
+                        title="test_bulk_create_passports_p1", consumer=self._consumer
+                    ),
+                    LTIPassport(
+                        title="test_bulk_create_passports_p2",
+                        consumer=self._consumer,
+                        oauth_consumer_key="custom_consumer_key",
+                        shared_secret="custom_secret",
+                    ),
+                ]
+            )
+
+        self.assertEqual(2, LTIPassport.objects.filter(consumer=self._consumer).count())
+        self.assertGreaterEqual(len(passports[0].oauth_consumer_key), 20)
+        self.assertGreaterEqual(len(passports[0].shared_secret), 40)
+        self.assertEqual("custom_consumer_key", passports[1].oauth_consumer_key)
+        self.assertEqual("custom_secret", passports[1].shared_secret)
+
+        with self.assertRaises(ValidationError):
+            LTIPassport.bulk_create_passports([LTIPassport(consumer=self._consumer)])
+
     def test_optional_url(self):
         """
         The url field of the model is optional and should be validated
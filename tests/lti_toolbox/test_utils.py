@@ -2,58 +2,117 @@
 
 from unittest import mock
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-from lti_toolbox.factories import LTIConsumerFactory
-from lti_toolbox.models import LTIPassport
+from lti_toolbox.models import LTIConsumer, LTIPassport
 from lti_toolbox.utils import sign_parameters
 
+_OAUTH_KEYS = frozenset(
+    {
+        "oauth_consumer_key",
+        "oauth_signature",
+        "oauth_timestamp",
+        "oauth_version",
+        "oauth_signature_method",
+        "oauth_nonce",
+    }
+)
 
-class SignParametersTestCase(TestCase):
-    """Test the sign_parameters utils function"""
+# Consumer key, shared secret, launch url and expected signature of the
+# {"test": "your_value"} parameters with a fixed nonce and timestamp.
+_SIGNATURE_CASES = (
+    (
+        "custom_consumer_key",
+        "random_shared_secret",
+        "http://testserver.com/",
+        "jyv1bLSHm94AFbT4plaehDnDMHE=",
+    ),
+    (
+        "another_consumer_key",
+        "another_shared_secret",
+        "http://testserver.com/",
+        "idRZpW3j4MP12a5d5ryWvuI2Qu0=",
+    ),
+    (
+        "custom_consumer_key",
+        "random_shared_secret",
+        "https://testserver.com/lti/launch/",
+        "iND/8AA4RAoccTLvVzvuD8aYzjw=",
+    ),
+)
 
-    @mock.patch(
-        "oauthlib.oauth1.rfc5849.generate_nonce",
-        return_value="59474787080480293391616018589",
-    )
-    @mock.patch("oauthlib.oauth1.rfc5849.generate_timestamp", return_value="1616018589")
-    def test_sign_parameters(self, mock_timestamp, mock_nonce):
-        """Test the oauth 1.0 signature."""
 
-        consumer = LTIConsumerFactory(
+class SignParametersTestCase(SimpleTestCase):
+    """Test the sign_parameters utils function"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the passport signing the parameters, signing needs no database."""
+        super().setUpClass()
+        consumer = LTIConsumer(
             slug="test_lti", title="test consumer", url="http://testserver.com"
         )
-
-        mocked_passport = LTIPassport(
+        cls._passport = LTIPassport(
             title="test_generate_keys_on_save_p2",
             consumer=consumer,
             oauth_consumer_key="custom_consumer_key",
             shared_secret="random_shared_secret",  # noqa: S106
         )
-        mocked_passport.save()
+
+    def test_sign_parameters(self):
+        """Test the oauth 1.0 signature."""
 
         parameters = {"test": "your_value"}
 
+        with mock.patch.multiple(
+            "oauthlib.oauth1.rfc5849",
+            generate_nonce=mock.DEFAULT,
+            generate_timestamp=mock.DEFAULT,
+        ) as mocks:
+            mocks["generate_nonce"].return_value = "59474787080480293391616018589"
+            mocks["generate_timestamp"].return_value = "1616018589"
+            for key, secret, url, expected_signature in _SIGNATURE_CASES:
+                with self.subTest(key=key, url=url):
+                    passport = LTIPassport(
+                        title="test_sign_parameters",
+                        consumer=self._passport.consumer,
+                        oauth_consumer_key=key,
+                        shared_secret=secret,
+                    )
+                    signed_parameters = sign_parameters(passport, parameters, url)
+
+                    self.assertEqual(
+                        mocks["generate_timestamp"].return_value,
+                        signed_parameters.get("oauth_timestamp"),
+                    )
+                    self.assertEqual(
+                        mocks["generate_nonce"].return_value,
+                        signed_parameters.get("oauth_nonce"),
+                    )
+                    self.assertEqual(key, signed_parameters.get("oauth_consumer_key"))
+                    self.assertEqual(
+                        expected_signature, signed_parameters.get("oauth_signature")
+                    )
+                    self.assertEqual("your_value", signed_parameters.get("test"))
+                    self.assertLessEqual(
+                        _OAUTH_KEYS | parameters.keys(), signed_parameters.keys()
+                    )
+
+    def test_sign_parameters_nonce_timestamp(self):
+        """The nonce and timestamp used to sign parameters can be fixed."""
+
         signed_parameters = sign_parameters(
-            mocked_passport, parameters, "http://testserver.com/"
+            self._passport,
+            {"test": "your_value"},
+            "http://testserver.com/",
+            nonce="59474787080480293391616018589",
+            timestamp="1616018589",
         )
 
+        self.assertEqual("1616018589", signed_parameters.get("oauth_timestamp"))
         self.assertEqual(
-            mock_timestamp.return_value, signed_parameters.get("oauth_timestamp")
+            "59474787080480293391616018589", signed_parameters.get("oauth_nonce")
         )
-        self.assertEqual(mock_nonce.return_value, signed_parameters.get("oauth_nonce"))
         self.assertEqual(
             "jyv1bLSHm94AFbT4plaehDnDMHE=", signed_parameters.get("oauth_signature")
         )
-        self.assertEqual("your_value", signed_parameters.get("test"))
-
-        oauth_keys = {
-            "oauth_consumer_key",
-            "oauth_signature",
-            "oauth_timestamp",
-            "oauth_version",
-            "oauth_signature_method",
-            "oauth_nonce",
-        }
-        self.assertTrue(all(k in signed_parameters for k in oauth_keys))
-        self.assertTrue(all(k in signed_parameters for k in parameters))
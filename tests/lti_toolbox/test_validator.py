@@ -0,0 +1,94 @@
+"""Test the LTI request validator."""
+
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from lti_toolbox.validator import LTIRequestValidator, _build_replay_key
+
+
+class BuildReplayKeyTestCase(SimpleTestCase):
+    """Test the keys of the replay protection cache."""
+
+    def test_build_replay_key_raw(self):
+        """Short keys made of safe characters should be used as is."""
+        self.assertEqual(
+            "LTI_TS_NONCE:consumer_key:1616018589:59474787080480293391616018589",
+            _build_replay_key(
+                "consumer_key", "1616018589", "59474787080480293391616018589"
+            ),
+        )
+
+    def test_build_replay_key_hashed(self):
+        """Keys with unsafe characters or too long should be hashed to a fixed size."""
+        for client_key, timestamp, nonce in (
+            ("consumer:key", "1616018589", "nonce"),
+            ("consumer_key", "1616018589", "nonce:value"),
+            ("consumer_ké", "1616018589", "nonce"),
+            ("consumer key", "1616018589", "nonce"),
+            ("consumer_key", "not a timestamp", "nonce"),
+            ("k" * 100, "1616018589", "n" * 20),
+        ):
+            with self.subTest(client_key=client_key, timestamp=timestamp, nonce=nonce):
+                key = _build_replay_key(client_key, timestamp, nonce)
+                self.assertRegex(key, r"^LTI_TS_NONCE:[0-9a-f]{32}$")
+
+    def test_build_replay_key_no_collision(self):
+        """Values joining to the same raw string should have different keys."""
+        keys = {
+            _build_replay_key("a:1", "2", "n"),
+            _build_replay_key("a", "1", "2:n"),
+            _build_replay_key("a", "1:2", "n"),
+            _build_replay_key("a", "1", "2"),
+        }
+        self.assertEqual(4, len(keys))
+
+
+class ValidateTimestampAndNonceTestCase(SimpleTestCase):
+    """Test the replay protection of the LTI request validator."""
+
+    def test_validate_timestamp_and_nonce_invalid(self):
+        """Invalid client keys and timestamps should be rejected without using the cache."""
+        validator = LTIRequestValidator()
+        for client_key, timestamp in (
+            ("", "1616018589"),
+            ("k" * 256, "1616018589"),
+            ("consumer_key", "not a timestamp"),
+            ("consumer_key", ""),
+        ):
+            with self.subTest(client_key=client_key, timestamp=timestamp):
+                with mock.patch("lti_toolbox.validator.caches") as mock_caches:
+                    self.assertFalse(
+                        validator.validate_timestamp_and_nonce(
+                            client_key, timestamp, "nonce", None
+                        )
+                    )
+                mock_caches.__getitem__.assert_not_called()
+
+    def test_validate_timestamp_and_nonce_timeout(self):
+        """Nonces should be kept in the cache until their timestamp is too old."""
+        validator = LTIRequestValidator()
+        for timestamp, expected_timeout in (
+            # Accepted for another 10 minutes
+            ("1616015589", 600),
+            # Current timestamp, accepted for the whole hour
+            ("1616018589", 3600),
+            # Oldest accepted timestamp, kept for at least one second
+            ("1616014989", 1),
+        ):
+            with self.subTest(timestamp=timestamp):
+                with mock.patch(
+                    "lti_toolbox.validator.time.time", return_value=1616018589.5
+                ), mock.patch("lti_toolbox.validator.caches") as mock_caches:
+                    mock_cache = mock_caches.__getitem__.return_value
+                    mock_cache.add.return_value = True
+                    self.assertTrue(
+                        validator.validate_timestamp_and_nonce(
+                            "consumer_key", timestamp, "nonce", None
+                        )
+                    )
+                mock_cache.add.assert_called_once_with(
+                    f"LTI_TS_NONCE:consumer_key:{timestamp:s}:nonce",
+                    "1",
+                    expected_timeout,
+                )
@@ -0,0 +1,82 @@
+"""Test the lti_toolbox views."""
+
+from urllib.parse import urlencode
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from lti_toolbox.factories import LTIPassportFactory
+from lti_toolbox.utils import CONTENT_TYPE, sign_parameters
+from lti_toolbox.views import BaseLTIAuthView, BaseLTIView
+
+
+class LTIView(BaseLTIView):
+    """Concrete LTI view."""
+
+    def _do_on_success(self, lti_request, *args, **kwargs):
+        return HttpResponse()
+
+
+class LTIAuthView(BaseLTIAuthView):
+    """Concrete LTI view with authentication."""
+
+    def _do_on_login(self, lti_request):
+        return HttpResponse()
+
+
+class BaseLTIViewsTestCase(SimpleTestCase):
+    """Test the base LTI views."""
+
+    def test_csrf_exempt(self):
+        """LTI views are exempted from CSRF protection."""
+        self.assertTrue(LTIView.as_view().csrf_exempt)
+        self.assertTrue(LTIAuthView.as_view().csrf_exempt)
+
+
+class BaseLTIViewPostTestCase(TestCase):
+    """Test the verification of LTI requests posted to the base LTI view."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the passport used to sign requests once for all tests."""
+        super().setUpTestData()
+        cls._passport = LTIPassportFactory(title="test_views passport")
+        cls._url = "http://testserver/lti/launch"
+
+    def _post(self, body):
+        request = RequestFactory().post(self._url, data=body, content_type=CONTENT_TYPE)
+        return LTIView.as_view()(request)
+
+    def test_post_signed(self):
+        """A signed LTI request should be processed."""
+        signed_parameters = sign_parameters(
+            self._passport,
+            {
+                "lti_message_type": "basic-lti-launch-request",
+                "lti_version": "LTI-1p0",
+                "resource_link_id": "df7",
+            },
+            self._url,
+        )
+        response = self._post(urlencode(signed_parameters))
+        self.assertEqual(200, response.status_code)
+
+    def test_post_undecodable_body(self):
+        """An LTI request whose body is not valid UTF-8 should be forbidden."""
+        signed_parameters = sign_parameters(
+            self._passport,
+            {
+                "lti_message_type": "basic-lti-launch-request",
+                "lti_version": "LTI-1p0",
+                "resource_link_id": "df7",
+                "context_title": "title",
+            },
+            self._url,
+        )
+        body = (
+            urlencode(signed_parameters)
+            .encode()
+            .replace(b"context_title=title", b"context_title=\xff")
+        )
+        response = self._post(body)
+        self.assertEqual(403, response.status_code)
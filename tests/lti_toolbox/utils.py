@@ -0,0 +1,27 @@
+"""Helpers for the lti_toolbox tests."""
+
+
+def fake_sign_parameters(passport, lti_parameters, url):
+    """Add fake oauth parameters to LTI parameters, without signing them.
+
+    Use it instead of `lti_toolbox.utils.sign_parameters` in tests that only need
+    the shape of signed parameters and never verify the signature.
+
+    Args:
+        passport: The LTIPassport supposed to sign the oauth request
+        lti_parameters: A dictionary of parameters
+        url: The LTI launch URL
+
+    Returns:
+        dict: The parameters with fake oauth parameters
+    """
+    del url  # The url is part of the signature, fake parameters do not depend on it
+    return {
+        **lti_parameters,
+        "oauth_consumer_key": passport.oauth_consumer_key,
+        "oauth_nonce": "59474787080480293391616018589",
+        "oauth_signature": "jyv1bLSHm94AFbT4plaehDnDMHE=",
+        "oauth_signature_method": "HMAC-SHA1",
+        "oauth_timestamp": "1616018589",
+        "oauth_version": "1.0",
+    }